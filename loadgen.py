@@ -15,24 +15,407 @@ Author: AI-Driven AutoScaling Demo
 """
 
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.exceptions import ProtocolError, ReadTimeoutError
 import time
 import threading
 import argparse
 import sys
 import signal
 import statistics
+import math
+import json
+import csv
+import array
+import struct
+import socket
+import hmac
+import ipaddress
+import os
 from datetime import datetime
-from typing import List, Dict, Optional
+from typing import List, Dict, Optional, Tuple
 import urllib.parse
 
 
+# Response handling modes
+RESPONSE_MODES = ('full', 'stream', 'head', 'ttfb')
+
+# Size of the per-worker buffer used to drain streamed response bodies
+STREAM_BUFFER_SIZE = 64 * 1024
+
+
+class RequestResult:
+    """Compact, reusable record holding the outcome of a single request"""
+    
+    __slots__ = ('success', 'status_code', 'response_time', 'content_length', 'error')
+    
+    def __init__(self):
+        self.reset()
+    
+    def reset(self):
+        """Clear the record so it can be filled by the next request"""
+        self.success = False
+        self.status_code = None
+        self.response_time = 0.0
+        self.content_length = 0
+        self.error = None
+
+
+# Time-series export formats
+TIMESERIES_FORMATS = ('jsonl', 'csv', 'bin')
+
+# Fixed numeric columns of a time-series bucket, with their array typecodes
+TIMESERIES_COLUMNS = (
+    ('timestamp', 'q'),
+    ('sent', 'Q'),
+    ('completed', 'Q'),
+    ('errors', 'Q'),
+    ('bytes', 'Q'),
+    ('latency_p50', 'd'),
+    ('latency_p90', 'd'),
+    ('latency_p99', 'd'),
+    ('latency_max', 'd'),
+)
+
+# Binary time-series file header: magic and format version
+TIMESERIES_MAGIC = b'LGTS'
+TIMESERIES_VERSION = 1
+
+# Rows per block in the binary time-series format; rows are buffered in
+# memory until a block is full, so an abnormal exit loses up to this many
+TIMESERIES_BLOCK_ROWS = 60
+
+# Default TCP port for distributed worker nodes
+DEFAULT_WORKER_PORT = 9100
+
+# Seconds a worker waits for the start message after a coordinator connects
+WORKER_HANDSHAKE_TIMEOUT = 10
+
+# Upper bounds a worker accepts for job settings
+MAX_JOB_THREADS = 1000
+MAX_JOB_TIMEOUT = 3600
+MAX_JOB_DURATION = 7 * 24 * 3600
+MAX_START_DELAY = 3600
+
+
+class LatencyHistogram:
+    """
+    Log-scale latency histogram that can be merged across load generators
+    
+    Bucket i > 0 holds values in (BASE * GROWTH**(i-1), BASE * GROWTH**i],
+    bucket 0 holds everything up to BASE, so percentiles are accurate to
+    within about 5%.
+    """
+    
+    BASE = 0.0001  # 0.1 ms
+    GROWTH = 1.05
+    
+    __slots__ = ('counts', 'count', 'total', 'max')
+    
+    def __init__(self):
+        self.counts = {}
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+    
+    def record(self, value: float):
+        """
+        Add one latency sample
+        
+        Args:
+            value: Latency in seconds
+        """
+        if value <= self.BASE:
+            index = 0
+        else:
+            index = int(math.ceil(math.log(value / self.BASE) / math.log(self.GROWTH)))
+        self.counts[index] = self.counts.get(index, 0) + 1
+        self.count += 1
+        self.total += value
+        if value > self.max:
+            self.max = value
+    
+    def merge(self, other: 'LatencyHistogram'):
+        """
+        Add all samples of another histogram to this one
+        
+        Args:
+            other: Histogram to merge in
+        """
+        for index, count in other.counts.items():
+            self.counts[index] = self.counts.get(index, 0) + count
+        self.count += other.count
+        self.total += other.total
+        self.max = max(self.max, other.max)
+    
+    def mean(self) -> float:
+        """Average latency in seconds (0.0 when empty)"""
+        return self.total / self.count if self.count else 0.0
+    
+    def percentile(self, pct: float) -> float:
+        """
+        Approximate percentile latency
+        
+        Args:
+            pct: Percentile between 0 and 100
+            
+        Returns:
+            Upper bound of the bucket holding the percentile, in seconds
+        """
+        if not self.count:
+            return 0.0
+        rank = max(int(math.ceil(pct / 100.0 * self.count)), 1)
+        seen = 0
+        for index in sorted(self.counts):
+            seen += self.counts[index]
+            if seen >= rank:
+                return min(self.BASE * self.GROWTH ** index, self.max)
+        return self.max
+    
+    def to_dict(self) -> Dict:
+        """Serialise the histogram for the coordinator protocol"""
+        return {
+            'counts': {str(index): count for index, count in self.counts.items()},
+            'count': self.count,
+            'total': self.total,
+            'max': self.max
+        }
+    
+    @classmethod
+    def from_dict(cls, data: Dict) -> 'LatencyHistogram':
+        """Rebuild a histogram serialised with to_dict()"""
+        histogram = cls()
+        histogram.counts = {int(index): count for index, count in data['counts'].items()}
+        histogram.count = data['count']
+        histogram.total = data['total']
+        histogram.max = data['max']
+        return histogram
+
+
+def _percentile(sorted_values: List[float], pct: float) -> float:
+    """
+    Nearest-rank percentile of an already sorted list
+    
+    Args:
+        sorted_values: Values sorted in ascending order
+        pct: Percentile between 0 and 100
+        
+    Returns:
+        Percentile value (0.0 for an empty list)
+    """
+    if not sorted_values:
+        return 0.0
+    rank = int(math.ceil(pct / 100.0 * len(sorted_values)))
+    return sorted_values[max(rank, 1) - 1]
+
+
+class _Bucket:
+    """Counters for one second of load generation"""
+    
+    __slots__ = ('sent', 'completed', 'errors', 'bytes', 'latencies')
+    
+    def __init__(self):
+        self.sent = 0
+        self.completed = 0
+        self.errors = {}
+        self.bytes = 0
+        self.latencies = []
+
+
+class TimeSeriesRecorder:
+    """
+    Aggregates request results into per-second buckets and writes them
+    to a JSONL, CSV or binary columnar file from a background thread
+    
+    Workers only update in-memory counters; buckets are closed one second
+    after they end, then summarised and written by the writer thread.
+    JSONL and CSV rows are flushed every second. Binary rows are written
+    in blocks of TIMESERIES_BLOCK_ROWS, so if the process is killed up to
+    a minute of rows is lost.
+    """
+    
+    def __init__(self, path: str, file_format: str = 'jsonl'):
+        """
+        Initialize the recorder
+        
+        Args:
+            path: Output file path
+            file_format: One of 'jsonl', 'csv' or 'bin'
+        """
+        if file_format not in TIMESERIES_FORMATS:
+            raise ValueError(f"Invalid time-series format: {file_format}")
+        
+        self.path = path
+        self.file_format = file_format
+        self.rows_written = 0
+        
+        self._lock = threading.Lock()
+        self._buckets = {}
+        self._pending = []
+        self._stop_event = threading.Event()
+        self._thread = None
+        self._file = None
+        self._csv = None
+    
+    def record_sent(self, now: float):
+        """
+        Record a request being sent
+        
+        Args:
+            now: Send time (epoch seconds)
+        """
+        second = int(now)
+        with self._lock:
+            bucket = self._buckets.get(second)
+            if bucket is None:
+                bucket = self._buckets[second] = _Bucket()
+            bucket.sent += 1
+    
+    def record_result(self, now: float, result: RequestResult):
+        """
+        Record a finished request
+        
+        Args:
+            now: Completion time (epoch seconds)
+            result: Outcome of the request
+        """
+        second = int(now)
+        with self._lock:
+            bucket = self._buckets.get(second)
+            if bucket is None:
+                bucket = self._buckets[second] = _Bucket()
+            if result.success:
+                bucket.completed += 1
+                bucket.bytes += result.content_length
+                bucket.latencies.append(result.response_time)
+            else:
+                bucket.errors[result.error] = bucket.errors.get(result.error, 0) + 1
+    
+    def start(self):
+        """Open the output file and start the writer thread"""
+        if self.file_format == 'bin':
+            self._file = open(self.path, 'wb')
+            self._file.write(TIMESERIES_MAGIC + struct.pack('<B', TIMESERIES_VERSION))
+        else:
+            self._file = open(self.path, 'w', newline='')
+            if self.file_format == 'csv':
+                self._csv = csv.writer(self._file)
+                self._csv.writerow([name for name, _ in TIMESERIES_COLUMNS] + ['time', 'error_types'])
+        
+        self._thread = threading.Thread(target=self._writer_thread)
+        self._thread.daemon = True
+        self._thread.start()
+    
+    def stop(self):
+        """Stop the writer thread, write all remaining buckets and close the file"""
+        self._stop_event.set()
+        if self._thread:
+            self._thread.join()
+        self._flush(final=True)
+        self._file.close()
+    
+    def _writer_thread(self):
+        """Background thread that writes closed buckets once per second"""
+        while not self._stop_event.wait(1):
+            try:
+                self._flush()
+            except Exception as e:
+                print(f"⚠️  Time-series writer error: {e}")
+    
+    def _flush(self, final: bool = False):
+        """
+        Summarise closed buckets and write them out
+        
+        Args:
+            final: Write every bucket, including the current second
+        """
+        cutoff = int(time.time()) - 1
+        with self._lock:
+            seconds = sorted(s for s in self._buckets if final or s < cutoff)
+            closed = [(s, self._buckets.pop(s)) for s in seconds]
+        
+        rows = [self._summarise(second, bucket) for second, bucket in closed]
+        
+        if self.file_format == 'bin':
+            self._pending.extend(rows)
+            while len(self._pending) >= TIMESERIES_BLOCK_ROWS:
+                self._write_block(self._pending[:TIMESERIES_BLOCK_ROWS])
+                del self._pending[:TIMESERIES_BLOCK_ROWS]
+            if final and self._pending:
+                self._write_block(self._pending)
+                self._pending = []
+        else:
+            for row in rows:
+                self._write_text_row(row)
+        
+        self.rows_written += len(rows)
+        if rows or final:
+            self._file.flush()
+    
+    def _summarise(self, second: int, bucket: _Bucket) -> Dict:
+        """Turn a bucket into an output row"""
+        latencies = sorted(bucket.latencies)
+        return {
+            'timestamp': second,
+            'sent': bucket.sent,
+            'completed': bucket.completed,
+            'errors': sum(bucket.errors.values()),
+            'bytes': bucket.bytes,
+            'latency_p50': _percentile(latencies, 50),
+            'latency_p90': _percentile(latencies, 90),
+            'latency_p99': _percentile(latencies, 99),
+            'latency_max': latencies[-1] if latencies else 0.0,
+            'error_types': bucket.errors,
+        }
+    
+    def _write_text_row(self, row: Dict):
+        """Write one row in JSONL or CSV format"""
+        # Local time, matching the timestamps in agent.log
+        row_time = datetime.fromtimestamp(row['timestamp']).isoformat()
+        if self.file_format == 'jsonl':
+            self._file.write(json.dumps(dict(row, time=row_time)) + '\n')
+        else:
+            # Error types are arbitrary exception text, so encode them as JSON
+            error_types = json.dumps(row['error_types'])
+            self._csv.writerow([row[name] for name, _ in TIMESERIES_COLUMNS] + [row_time, error_types])
+    
+    def _write_block(self, rows: List[Dict]):
+        """
+        Write one block of the binary columnar format
+        
+        Block layout (little-endian): row count (uint32), then each column
+        of TIMESERIES_COLUMNS as a packed array, then a length-prefixed
+        (uint32) JSON object mapping error type to per-row counts.
+        """
+        parts = [struct.pack('<I', len(rows))]
+        for name, typecode in TIMESERIES_COLUMNS:
+            column = array.array(typecode, (row[name] for row in rows))
+            if sys.byteorder != 'little':
+                column.byteswap()
+            parts.append(column.tobytes())
+        
+        error_types = {}
+        for i, row in enumerate(rows):
+            for error_type, count in row['error_types'].items():
+                error_types.setdefault(error_type, [0] * len(rows))[i] = count
+        blob = json.dumps(error_types).encode('utf-8')
+        parts.append(struct.pack('<I', len(blob)))
+        parts.append(blob)
+        
+        self._file.write(b''.join(parts))
+
+
 class LoadGenerator:
     """HTTP Load Generator for testing auto-scaling"""
     
     def __init__(self, target_url: str, requests_per_second: int, 
                  duration: Optional[int] = None, 
                  concurrent_threads: int = 10,
-                 timeout: int = 30):
+                 timeout: int = 30,
+                 keep_alive: bool = True,
+                 response_mode: str = 'full',
+                 timeseries_path: Optional[str] = None,
+                 timeseries_format: str = 'jsonl'):
         """
         Initialize the Load Generator
         
@@ -42,23 +425,53 @@ class LoadGenerator:
             duration: Duration in seconds (None for infinite)
             concurrent_threads: Number of concurrent threads
             timeout: Request timeout in seconds
+            keep_alive: Reuse pooled connections (False forces a new
+                connection for every request)
+            response_mode: How responses are handled, one of:
+                'full' - buffer the whole body (original behaviour)
+                'stream' - drain the body through a reusable buffer, counting bytes
+                'head' - send HEAD requests, no body is transferred
+                'ttfb' - time to first byte only; body is drained and discarded
+            timeseries_path: File to stream per-second results to (None disables)
+            timeseries_format: Time-series file format ('jsonl', 'csv' or 'bin')
         """
+        if response_mode not in RESPONSE_MODES:
+            raise ValueError(f"Invalid response mode: {response_mode}")
+        
         self.target_url = target_url.rstrip('/')
         self.requests_per_second = requests_per_second
         self.duration = duration
         self.concurrent_threads = concurrent_threads
         self.timeout = timeout
+        self.keep_alive = keep_alive
+        self.response_mode = response_mode
+        self._stream = response_mode in ('stream', 'ttfb')
+        self.timeseries = None
+        if timeseries_path:
+            self.timeseries = TimeSeriesRecorder(timeseries_path, timeseries_format)
+        
+        # Per-worker HTTP session and pre-built request template
+        self._local = threading.local()
+        self._headers = {
+            'User-Agent': 'LoadGenerator/1.0',
+            'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8'
+        }
+        if not self.keep_alive:
+            self._headers['Connection'] = 'close'
         
         # Statistics tracking
+        self._stats_lock = threading.Lock()
         self.stats = {
             'total_requests': 0,
             'successful_requests': 0,
             'failed_requests': 0,
+            'total_bytes': 0,
             'response_times': [],
             'start_time': None,
             'end_time': None,
             'errors': {}
         }
+        self.histogram = LatencyHistogram()
         
         # Control flags
         self.running = False
@@ -74,65 +487,149 @@ class LoadGenerator:
         print(f"Concurrent threads: {self.concurrent_threads}")
         print(f"Duration: {'Infinite' if duration is None else f'{duration}s'}")
         print(f"Timeout: {self.timeout}s")
+        print(f"Connections: {'keep-alive (pooled)' if keep_alive else 'new per request'}")
+        print(f"Response mode: {self.response_mode}")
+        if self.timeseries:
+            print(f"Time series: {self.timeseries.path} ({self.timeseries.file_format})")
     
     def _signal_handler(self, signum, frame):
         """Handle shutdown signals"""
         print(f"\n🛑 Received signal {signum}, shutting down gracefully...")
         self.stop()
     
-    def _make_request(self) -> Dict:
+    def _create_session(self) -> requests.Session:
+        """
+        Create an HTTP session for a single worker thread
+        
+        Each worker sends one request at a time, so one pooled connection
+        per worker keeps the total pool size equal to the thread count.
+        
+        Returns:
+            Configured requests session
+        """
+        session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=1, pool_maxsize=1, max_retries=0)
+        session.mount('http://', adapter)
+        session.mount('https://', adapter)
+        return session
+    
+    def _get_worker_context(self):
+        """
+        Get the session, prepared request and send settings for the calling thread
+        
+        Returns:
+            Tuple of (session, prepared request, keyword arguments for send)
+        """
+        session = getattr(self._local, 'session', None)
+        if session is None:
+            session = self._create_session()
+            method = 'HEAD' if self.response_mode == 'head' else 'GET'
+            self._local.session = session
+            self._local.prepared = session.prepare_request(
+                requests.Request(method, self.target_url, headers=self._headers)
+            )
+            # Session.send skips the environment lookup requests.get does,
+            # so resolve proxies and CA bundle settings once per worker
+            settings = session.merge_environment_settings(
+                self._local.prepared.url, {}, None, None, None
+            )
+            settings.pop('stream', None)
+            self._local.settings = settings
+            self._local.result = RequestResult()
+            if self._stream:
+                self._local.buffer = memoryview(bytearray(STREAM_BUFFER_SIZE))
+        return session, self._local.prepared, self._local.settings
+    
+    def _close_worker_context(self):
+        """Close the calling thread's session and its pooled connections"""
+        session = getattr(self._local, 'session', None)
+        if session is not None:
+            session.close()
+            self._local.session = None
+            self._local.prepared = None
+            self._local.settings = None
+            self._local.result = None
+            self._local.buffer = None
+    
+    def _drain_response(self, response: requests.Response) -> int:
+        """
+        Read a streamed response body into the worker buffer and discard it
+        
+        Args:
+            response: Response opened with stream=True
+            
+        Returns:
+            Number of body bytes received (before content decoding)
+            
+        Raises:
+            requests.exceptions.Timeout: If the body stalls past the timeout
+            requests.exceptions.ConnectionError: If the body is cut short
+        """
+        raw = response.raw
+        buffer = self._local.buffer
+        total = 0
+        # Map urllib3 errors the same way response.content does in full mode
+        try:
+            read = raw.readinto(buffer)
+            while read:
+                total += read
+                read = raw.readinto(buffer)
+        except ReadTimeoutError as e:
+            response.close()
+            raise requests.exceptions.Timeout(e)
+        except ProtocolError as e:
+            response.close()
+            raise requests.exceptions.ConnectionError(e)
+        # Body fully consumed, hand the connection back to the pool
+        raw.release_conn()
+        return total
+    
+    def _make_request(self) -> RequestResult:
         """
         Make a single HTTP request
         
+        The returned record is owned by the calling worker thread and is
+        overwritten by its next request.
+        
         Returns:
-            Dictionary with request results
+            RequestResult with request results
         """
+        session, prepared, settings = self._get_worker_context()
+        result = self._local.result
+        result.reset()
         start_time = time.time()
         
         try:
-            response = requests.get(
-                self.target_url,
-                timeout=self.timeout,
-                headers={
-                    'User-Agent': 'LoadGenerator/1.0',
-                    'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8'
-                }
-            )
+            response = session.send(prepared, timeout=self.timeout, stream=self._stream, **settings)
             
-            response_time = time.time() - start_time
+            if self.response_mode == 'ttfb':
+                result.response_time = time.time() - start_time
+                result.content_length = self._drain_response(response)
+            elif self.response_mode == 'stream':
+                result.content_length = self._drain_response(response)
+                result.response_time = time.time() - start_time
+            else:
+                result.response_time = time.time() - start_time
+                result.content_length = len(response.content)
             
-            return {
-                'success': True,
-                'status_code': response.status_code,
-                'response_time': response_time,
-                'content_length': len(response.content),
-                'error': None
-            }
+            result.success = True
+            result.status_code = response.status_code
             
         except requests.exceptions.Timeout:
-            return {
-                'success': False,
-                'status_code': None,
-                'response_time': time.time() - start_time,
-                'content_length': 0,
-                'error': 'Timeout'
-            }
-        except requests.exceptions.ConnectionError:
-            return {
-                'success': False,
-                'status_code': None,
-                'response_time': time.time() - start_time,
-                'content_length': 0,
-                'error': 'Connection Error'
-            }
+            result.response_time = time.time() - start_time
+            result.error = 'Timeout'
+        except (requests.exceptions.ConnectionError, requests.exceptions.ChunkedEncodingError):
+            result.response_time = time.time() - start_time
+            result.error = 'Connection Error'
         except Exception as e:
-            return {
-                'success': False,
-                'status_code': None,
-                'response_time': time.time() - start_time,
-                'content_length': 0,
-                'error': str(e)
-            }
+            result.response_time = time.time() - start_time
+            result.error = str(e)
+        
+        if not self.keep_alive:
+            # Drop the connection now rather than racing the server's close
+            session.close()
+        
+        return result
     
     def _worker_thread(self, thread_id: int):
         """
@@ -156,23 +653,35 @@ class LoadGenerator:
                 if not self.running or self.stop_event.is_set():
                     break
                 
+                if self.timeseries:
+                    self.timeseries.record_sent(time.time())
+                
                 result = self._make_request()
                 
+                if self.timeseries:
+                    # Completion time, not send time plus response_time: in
+                    # ttfb mode response_time stops before the body is drained
+                    self.timeseries.record_result(time.time(), result)
+                
                 # Update statistics
-                with threading.Lock():
+                with self._stats_lock:
                     self.stats['total_requests'] += 1
                     
-                    if result['success']:
+                    if result.success:
                         self.stats['successful_requests'] += 1
-                        self.stats['response_times'].append(result['response_time'])
+                        self.stats['total_bytes'] += result.content_length
+                        self.stats['response_times'].append(result.response_time)
+                        self.histogram.record(result.response_time)
                     else:
                         self.stats['failed_requests'] += 1
-                        error_type = result['error']
+                        error_type = result.error
                         self.stats['errors'][error_type] = self.stats['errors'].get(error_type, 0) + 1
             
             # Sleep for the remainder of the second
             if interval > 0:
                 time.sleep(interval)
+        
+        self._close_worker_context()
     
     def _stats_thread(self):
         """Thread that prints statistics every 10 seconds"""
@@ -193,10 +702,42 @@ class LoadGenerator:
                       f"{success_rate:.1f}% success, "
                       f"{avg_response_time:.3f}s avg response")
     
-    def start(self):
-        """Start the load generator"""
+    def snapshot(self) -> Dict:
+        """
+        Take a consistent copy of the cumulative statistics
+        
+        Returns:
+            Dictionary of counters, errors and the serialised latency histogram
+        """
+        with self._stats_lock:
+            return {
+                'total_requests': self.stats['total_requests'],
+                'successful_requests': self.stats['successful_requests'],
+                'failed_requests': self.stats['failed_requests'],
+                'total_bytes': self.stats['total_bytes'],
+                'errors': dict(self.stats['errors']),
+                'histogram': self.histogram.to_dict()
+            }
+    
+    def start(self, start_at: Optional[float] = None):
+        """
+        Start the load generator
+        
+        Args:
+            start_at: Epoch time to start sending at (default: immediately)
+        """
+        if start_at:
+            delay = start_at - time.time()
+            if delay > 0:
+                print(f"⏳ Waiting {delay:.1f}s for shared start time...")
+                if self.stop_event.wait(delay):
+                    return
+        
         print(f"🚀 Starting load generation...")
         
+        if self.timeseries:
+            self.timeseries.start()
+        
         self.running = True
         self.stats['start_time'] = time.time()
         
@@ -216,7 +757,7 @@ class LoadGenerator:
         # Wait for duration or until stopped
         if self.duration:
             print(f"⏱️  Running for {self.duration} seconds...")
-            time.sleep(self.duration)
+            self.stop_event.wait(self.duration)
             self.stop()
         else:
             print(f"♾️  Running indefinitely (Ctrl+C to stop)...")
@@ -230,6 +771,10 @@ class LoadGenerator:
         for thread in threads:
             thread.join(timeout=5)
         
+        if self.timeseries:
+            self.timeseries.stop()
+            print(f"💾 Wrote {self.timeseries.rows_written} time-series rows to {self.timeseries.path}")
+        
         self._print_final_stats()
     
     def stop(self):
@@ -273,6 +818,431 @@ class LoadGenerator:
                     print(f"  {error_type}: {count}")
 
 
+class LoadWorker:
+    """
+    Worker node for distributed load generation
+    
+    Listens for a coordinator, runs the LoadGenerator job it is sent and
+    reports cumulative stats back once a second. Jobs are served one at a
+    time until the process is stopped.
+    
+    Workers listening on a non-loopback address require a shared token,
+    which the coordinator must send in its start message.
+    
+    Protocol: newline-delimited JSON messages over TCP.
+        coordinator -> worker: {"type": "start", ...job}, {"type": "stop"}
+        worker -> coordinator: {"type": "stats", "stats": ...},
+                               {"type": "final", "stats": ...},
+                               {"type": "error", "message": ...}
+    """
+    
+    def __init__(self, host: str = '127.0.0.1', port: int = DEFAULT_WORKER_PORT,
+                 token: Optional[str] = None):
+        """
+        Initialize the worker node
+        
+        Args:
+            host: Address to listen on
+            port: TCP port to listen on
+            token: Shared token coordinators must present (required unless
+                listening on a loopback address)
+            
+        Raises:
+            ValueError: If listening beyond loopback without a token
+        """
+        if not token and not is_loopback(host):
+            raise ValueError("a token is required when listening on a non-loopback address")
+        
+        self.host = host
+        self.port = port
+        self.token = token
+        self._send_lock = threading.Lock()
+    
+    def serve(self):
+        """Accept coordinator connections and run their jobs until interrupted"""
+        with socket.create_server((self.host, self.port)) as server:
+            print(f"🛰️  Worker listening on {self.host}:{self.port}"
+                  f"{' (token required)' if self.token else ''}")
+            while True:
+                conn, addr = server.accept()
+                print(f"🔗 Coordinator connected from {addr[0]}:{addr[1]}")
+                with conn:
+                    # One failed job must not take the worker down
+                    try:
+                        self._run_job(conn)
+                    except Exception as e:
+                        print(f"⚠️  Job failed: {e}")
+                # LoadGenerator installs its own handlers; restore the defaults
+                # so Ctrl+C stops the worker between jobs
+                signal.signal(signal.SIGINT, signal.default_int_handler)
+                signal.signal(signal.SIGTERM, signal.SIG_DFL)
+    
+    def _send(self, conn: socket.socket, message: Dict):
+        """Send one protocol message"""
+        data = (json.dumps(message) + '\n').encode('utf-8')
+        with self._send_lock:
+            conn.sendall(data)
+    
+    def _validate_job(self, message) -> Optional[str]:
+        """
+        Check a start message before running it
+        
+        Args:
+            message: Decoded start message
+            
+        Returns:
+            Error description, or None if the job is valid
+        """
+        if not isinstance(message, dict) or message.get('type') != 'start':
+            return 'expected start message'
+        
+        if self.token and not hmac.compare_digest(
+                str(message.get('token', '')).encode('utf-8'), self.token.encode('utf-8')):
+            return 'invalid token'
+        
+        def is_int(value):
+            return isinstance(value, int) and not isinstance(value, bool)
+        
+        def is_number(value):
+            return (isinstance(value, (int, float)) and not isinstance(value, bool)
+                    and math.isfinite(value))
+        
+        checks = (
+            ('url', lambda v: isinstance(v, str) and v.startswith(('http://', 'https://'))),
+            ('rps', lambda v: is_int(v) and v > 0),
+            ('threads', lambda v: is_int(v) and 0 < v <= MAX_JOB_THREADS),
+            ('timeout', lambda v: is_number(v) and 0 < v <= MAX_JOB_TIMEOUT),
+            ('duration', lambda v: v is None or (is_int(v) and 0 < v <= MAX_JOB_DURATION)),
+            ('keep_alive', lambda v: isinstance(v, bool)),
+            ('response_mode', lambda v: v in RESPONSE_MODES),
+            ('start_delay', lambda v: is_number(v) and 0 <= v <= MAX_START_DELAY),
+        )
+        for field, check in checks:
+            if field not in message:
+                return f"missing field: {field}"
+            if not check(message[field]):
+                return f"invalid {field}: {message[field]!r}"
+        return None
+    
+    def _run_job(self, conn: socket.socket):
+        """
+        Run a single job for a connected coordinator
+        
+        Args:
+            conn: Coordinator connection
+        """
+        reader = conn.makefile('r', encoding='utf-8')
+        conn.settimeout(WORKER_HANDSHAKE_TIMEOUT)
+        line = reader.readline()
+        conn.settimeout(None)
+        
+        try:
+            message = json.loads(line)
+        except ValueError:
+            message = None
+        error = self._validate_job(message)
+        if error:
+            print(f"⚠️  Rejected job: {error}")
+            self._send(conn, {'type': 'error', 'message': error})
+            return
+        
+        # The start delay is relative so worker clocks need not be in sync
+        start_at = time.time() + message['start_delay']
+        
+        generator = LoadGenerator(
+            target_url=message['url'],
+            requests_per_second=message['rps'],
+            duration=message['duration'],
+            concurrent_threads=message['threads'],
+            timeout=message['timeout'],
+            keep_alive=message['keep_alive'],
+            response_mode=message['response_mode']
+        )
+        
+        done = threading.Event()
+        
+        def listen():
+            # A stop message or a dropped connection ends the job
+            try:
+                for line in reader:
+                    message = json.loads(line)
+                    if isinstance(message, dict) and message.get('type') == 'stop':
+                        break
+            except (OSError, ValueError):
+                pass
+            generator.stop()
+        
+        def report():
+            while not done.wait(1):
+                try:
+                    self._send(conn, {'type': 'stats', 'stats': generator.snapshot()})
+                except OSError:
+                    generator.stop()
+                    return
+        
+        for target in (listen, report):
+            thread = threading.Thread(target=target)
+            thread.daemon = True
+            thread.start()
+        
+        generator.start(start_at=start_at)
+        done.set()
+        self._send(conn, {'type': 'final', 'stats': generator.snapshot()})
+
+
+class LoadCoordinator:
+    """
+    Coordinator for distributed load generation
+    
+    Splits the target rate across worker nodes, gives them a shared start
+    time and merges their counters and latency histograms live.
+    
+    The start time is sent as a delay relative to when each worker
+    receives its job, so workers line up to within network latency without
+    needing synchronised clocks.
+    """
+    
+    def __init__(self, target_url: str, requests_per_second: int,
+                 workers: List[Tuple[str, int]],
+                 duration: Optional[int] = None,
+                 concurrent_threads: int = 10,
+                 timeout: int = 30,
+                 keep_alive: bool = True,
+                 response_mode: str = 'full',
+                 start_delay: float = 3.0,
+                 token: Optional[str] = None):
+        """
+        Initialize the coordinator
+        
+        Args:
+            target_url: Target URL to send requests to
+            requests_per_second: Total target requests per second across all workers
+            workers: (host, port) address of each worker node
+            duration: Duration in seconds (None for infinite)
+            concurrent_threads: Number of concurrent threads on each worker
+            timeout: Request timeout in seconds
+            keep_alive: Reuse pooled connections on the workers
+            response_mode: Response handling mode used by the workers
+            start_delay: Seconds between sending the jobs and the shared start time
+            token: Shared token sent to workers that require one
+        """
+        if not workers:
+            raise ValueError("At least one worker is required")
+        if requests_per_second < len(workers):
+            raise ValueError("Requests per second must be at least the number of workers")
+        
+        self.target_url = target_url.rstrip('/')
+        self.requests_per_second = requests_per_second
+        self.workers = workers
+        self.duration = duration
+        self.concurrent_threads = concurrent_threads
+        self.timeout = timeout
+        self.keep_alive = keep_alive
+        self.response_mode = response_mode
+        self.start_delay = start_delay
+        self.token = token
+        
+        self.start_at = None
+        self.end_time = None
+        self._connections = []
+        self._snapshots = {}
+        self._finished = {}
+        self._lock = threading.Lock()
+        self.stop_event = threading.Event()
+        
+        signal.signal(signal.SIGINT, self._signal_handler)
+        signal.signal(signal.SIGTERM, self._signal_handler)
+        
+        print(f"🎯 Load Coordinator initialized")
+        print(f"Target URL: {self.target_url}")
+        print(f"Target RPS: {self.requests_per_second} across {len(self.workers)} workers")
+        print(f"Threads per worker: {self.concurrent_threads}")
+        print(f"Duration: {'Infinite' if duration is None else f'{duration}s'}")
+    
+    def _signal_handler(self, signum, frame):
+        """Handle shutdown signals"""
+        print(f"\n🛑 Received signal {signum}, stopping workers...")
+        self.stop()
+    
+    def _worker_rates(self) -> List[int]:
+        """Split the target rate across workers, spreading the remainder"""
+        share, extra = divmod(self.requests_per_second, len(self.workers))
+        return [share + (1 if i < extra else 0) for i in range(len(self.workers))]
+    
+    def _send(self, conn: socket.socket, message: Dict):
+        """Send one protocol message"""
+        conn.sendall((json.dumps(message) + '\n').encode('utf-8'))
+    
+    def _reader_thread(self, name: str, conn: socket.socket):
+        """
+        Thread that collects stats messages from one worker
+        
+        Args:
+            name: Worker address as host:port
+            conn: Worker connection
+        """
+        try:
+            for line in conn.makefile('r', encoding='utf-8'):
+                message = json.loads(line)
+                if not isinstance(message, dict):
+                    raise ValueError(f"unexpected message: {line.strip()[:80]}")
+                message_type = message.get('type')
+                if message_type == 'error':
+                    print(f"⚠️  Worker {name}: {message.get('message')}")
+                    break
+                if message_type not in ('stats', 'final'):
+                    continue
+                if not isinstance(message.get('stats'), dict):
+                    raise ValueError(f"{message_type} message without stats")
+                with self._lock:
+                    self._snapshots[name] = message['stats']
+                if message_type == 'final':
+                    break
+        except (OSError, ValueError) as e:
+            print(f"⚠️  Lost worker {name}: {e}")
+        finally:
+            self._finished[name].set()
+    
+    def merged_stats(self) -> Dict:
+        """
+        Merge the latest stats reported by all workers
+        
+        Returns:
+            Dictionary with summed counters, merged errors and a merged
+            LatencyHistogram under 'histogram'
+        """
+        merged = {
+            'total_requests': 0,
+            'successful_requests': 0,
+            'failed_requests': 0,
+            'total_bytes': 0,
+            'errors': {},
+            'histogram': LatencyHistogram(),
+            'workers_reporting': 0
+        }
+        with self._lock:
+            snapshots = list(self._snapshots.values())
+        for snapshot in snapshots:
+            for key in ('total_requests', 'successful_requests', 'failed_requests', 'total_bytes'):
+                merged[key] += snapshot[key]
+            for error_type, count in snapshot['errors'].items():
+                merged['errors'][error_type] = merged['errors'].get(error_type, 0) + count
+            merged['histogram'].merge(LatencyHistogram.from_dict(snapshot['histogram']))
+            merged['workers_reporting'] += 1
+        return merged
+    
+    def start(self):
+        """Send jobs to all workers, monitor them and print merged statistics"""
+        # Connect to every worker first so the jobs go out back to back
+        for host, port in self.workers:
+            conn = socket.create_connection((host, port), timeout=10)
+            conn.settimeout(None)
+            self._connections.append(conn)
+        
+        self.start_at = time.time() + self.start_delay
+        
+        for (host, port), conn, rate in zip(self.workers, self._connections, self._worker_rates()):
+            name = f"{host}:{port}"
+            self._finished[name] = threading.Event()
+            job = {
+                'type': 'start',
+                'url': self.target_url,
+                'rps': rate,
+                'duration': self.duration,
+                'threads': self.concurrent_threads,
+                'timeout': self.timeout,
+                'keep_alive': self.keep_alive,
+                'response_mode': self.response_mode,
+                'start_delay': max(self.start_at - time.time(), 0.0)
+            }
+            if self.token:
+                job['token'] = self.token
+            self._send(conn, job)
+            thread = threading.Thread(target=self._reader_thread, args=(name, conn))
+            thread.daemon = True
+            thread.start()
+            print(f"📡 Worker {name}: {rate} RPS")
+        
+        print(f"🚀 Starting distributed load generation in {self.start_delay:.0f}s...")
+        
+        deadline = self.start_at + self.duration if self.duration else None
+        last_report = time.time()
+        while not self.stop_event.wait(1):
+            if all(event.is_set() for event in self._finished.values()):
+                break
+            if deadline and time.time() >= deadline:
+                break
+            if time.time() - last_report >= 10:
+                last_report = time.time()
+                self._print_stats()
+        
+        self.stop()
+        
+        # Give workers time to drain in-flight requests and send final stats
+        for event in self._finished.values():
+            event.wait(timeout=self.timeout + 10)
+        for conn in self._connections:
+            conn.close()
+        
+        self._print_final_stats()
+    
+    def stop(self):
+        """Tell all workers to stop"""
+        if self.end_time is None:
+            self.end_time = time.time()
+        self.stop_event.set()
+        for conn in self._connections:
+            try:
+                self._send(conn, {'type': 'stop'})
+            except OSError:
+                pass
+    
+    def _print_stats(self):
+        """Print merged live statistics"""
+        stats = self.merged_stats()
+        if stats['total_requests'] == 0:
+            return
+        elapsed = max(time.time() - self.start_at, 1e-6)
+        histogram = stats['histogram']
+        success_rate = (stats['successful_requests'] / stats['total_requests']) * 100
+        print(f"📊 Stats ({stats['workers_reporting']}/{len(self.workers)} workers): "
+              f"{stats['total_requests']} requests, "
+              f"{stats['total_requests'] / elapsed:.1f} RPS, "
+              f"{success_rate:.1f}% success, "
+              f"p50 {histogram.percentile(50):.3f}s, p99 {histogram.percentile(99):.3f}s")
+    
+    def _print_final_stats(self):
+        """Print merged final statistics"""
+        stats = self.merged_stats()
+        histogram = stats['histogram']
+        total_time = max(self.end_time - self.start_at, 1e-6)
+        
+        print(f"\n📈 Final Statistics ({stats['workers_reporting']}/{len(self.workers)} workers):")
+        print(f"=" * 50)
+        print(f"Total time: {total_time:.1f} seconds")
+        print(f"Total requests: {stats['total_requests']}")
+        print(f"Average RPS: {stats['total_requests'] / total_time:.1f}")
+        print(f"Successful requests: {stats['successful_requests']}")
+        print(f"Failed requests: {stats['failed_requests']}")
+        
+        if stats['total_requests'] > 0:
+            success_rate = (stats['successful_requests'] / stats['total_requests']) * 100
+            print(f"Success rate: {success_rate:.1f}%")
+        
+        if histogram.count:
+            print(f"Response times:")
+            print(f"  Average: {histogram.mean():.3f}s")
+            print(f"  p50: {histogram.percentile(50):.3f}s")
+            print(f"  p90: {histogram.percentile(90):.3f}s")
+            print(f"  p99: {histogram.percentile(99):.3f}s")
+            print(f"  Max: {histogram.max:.3f}s")
+        
+        if stats['errors']:
+            print(f"Errors:")
+            for error_type, count in stats['errors'].items():
+                print(f"  {error_type}: {count}")
+
+
 def validate_url(url: str) -> str:
     """
     Validate and normalize URL
@@ -298,6 +1268,146 @@ def validate_url(url: str) -> str:
         raise ValueError(f"Invalid URL: {e}")
 
 
+def parse_address(address: str) -> Tuple[str, int]:
+    """
+    Parse a HOST:PORT worker address
+    
+    Args:
+        address: Address such as 10.0.1.5:9100 or 10.0.1.5 (default port)
+        
+    Returns:
+        Tuple of (host, port)
+        
+    Raises:
+        ValueError: If the address is invalid
+    """
+    host, sep, port = address.strip().rpartition(':')
+    if not sep:
+        host, port = port, str(DEFAULT_WORKER_PORT)
+    try:
+        port_number = int(port)
+    except ValueError:
+        raise ValueError(f"Invalid port in address: {address}")
+    if not 0 < port_number < 65536:
+        raise ValueError(f"Invalid port in address: {address}")
+    return host or '0.0.0.0', port_number
+
+
+def is_loopback(host: str) -> bool:
+    """
+    Check whether a listen address only accepts local connections
+    
+    Args:
+        host: Host name or IP address
+        
+    Returns:
+        True for localhost and loopback IP addresses
+    """
+    if host == 'localhost':
+        return True
+    try:
+        return ipaddress.ip_address(host).is_loopback
+    except ValueError:
+        return False
+
+
+def load_timeseries(path: str, file_format: Optional[str] = None) -> Dict[str, list]:
+    """
+    Load a time-series file written by the load generator
+    
+    Args:
+        path: Time-series file path
+        file_format: 'jsonl', 'csv' or 'bin' (default: from file extension)
+        
+    Returns:
+        Dictionary mapping each column name to a list of per-second values,
+        plus 'error_types' mapping each error type to per-second counts
+        
+    Raises:
+        ValueError: If the file is not a valid time-series file
+    """
+    file_format = file_format or timeseries_format_for(path)
+    columns = {name: [] for name, _ in TIMESERIES_COLUMNS}
+    error_types = {}
+    rows = 0
+    
+    if file_format == 'bin':
+        with open(path, 'rb') as f:
+            data = f.read()
+        offset = 0
+        
+        def take(size: int) -> bytes:
+            # A run killed mid-write can leave a partial block at the end
+            nonlocal offset
+            if offset + size > len(data):
+                raise ValueError(f"Truncated time-series file: {path}")
+            chunk = data[offset:offset + size]
+            offset += size
+            return chunk
+        
+        if take(len(TIMESERIES_MAGIC)) != TIMESERIES_MAGIC:
+            raise ValueError(f"Not a load generator time-series file: {path}")
+        (version,) = struct.unpack('<B', take(1))
+        if version != TIMESERIES_VERSION:
+            raise ValueError(f"Unsupported time-series version: {version}")
+        
+        while offset < len(data):
+            (count,) = struct.unpack('<I', take(4))
+            for name, typecode in TIMESERIES_COLUMNS:
+                column = array.array(typecode)
+                column.frombytes(take(column.itemsize * count))
+                if sys.byteorder != 'little':
+                    column.byteswap()
+                columns[name].extend(column)
+            (blob_size,) = struct.unpack('<I', take(4))
+            block_errors = json.loads(take(blob_size).decode('utf-8'))
+            for error_type, counts in block_errors.items():
+                error_types.setdefault(error_type, [0] * rows).extend(counts)
+            rows += count
+            for counts in error_types.values():
+                counts.extend([0] * (rows - len(counts)))
+        
+    else:
+        with open(path, newline='') as f:
+            if file_format == 'jsonl':
+                records = (json.loads(line) for line in f if line.strip())
+            else:
+                records = csv.DictReader(f)
+            for record in records:
+                for name, typecode in TIMESERIES_COLUMNS:
+                    value = record[name]
+                    columns[name].append(float(value) if typecode == 'd' else int(value))
+                row_errors = record['error_types']
+                if isinstance(row_errors, str):
+                    row_errors = json.loads(row_errors) if row_errors else {}
+                for error_type, count in row_errors.items():
+                    error_types.setdefault(error_type, [0] * rows)
+                rows += 1
+                for error_type, counts in error_types.items():
+                    counts.append(int(row_errors.get(error_type, 0)))
+    
+    columns['error_types'] = error_types
+    return columns
+
+
+def timeseries_format_for(path: str) -> str:
+    """
+    Pick a time-series format from a file extension
+    
+    Args:
+        path: Time-series file path
+        
+    Returns:
+        'csv' for .csv, 'bin' for .bin, otherwise 'jsonl'
+    """
+    lower = path.lower()
+    if lower.endswith('.csv'):
+        return 'csv'
+    if lower.endswith('.bin'):
+        return 'bin'
+    return 'jsonl'
+
+
 def main():
     """Main function with command line argument parsing"""
     parser = argparse.ArgumentParser(
@@ -316,20 +1426,69 @@ Examples:
   
   # Test with HTTPS
   python3 loadgen.py https://my-alb-123456789.us-east-1.elb.amazonaws.com 75
+  
+  # Force a new TCP/TLS connection for every request (no keep-alive)
+  python3 loadgen.py http://my-alb-123456789.us-east-1.elb.amazonaws.com 50 --new-connections
+  
+  # Stream and discard response bodies to keep generator overhead low
+  python3 loadgen.py http://my-alb-123456789.us-east-1.elb.amazonaws.com 200 --response-mode stream
+  
+  # Export per-second results to line up with agent.log afterwards
+  python3 loadgen.py http://my-alb-123456789.us-east-1.elb.amazonaws.com 100 --timeseries run.jsonl
+  
+  # Distributed: start a worker on each load generator host...
+  LOADGEN_TOKEN=secret python3 loadgen.py --worker --listen 0.0.0.0:9100
+  
+  # ...then split 1000 RPS across them from a coordinator
+  LOADGEN_TOKEN=secret python3 loadgen.py http://my-alb-123456789.us-east-1.elb.amazonaws.com 1000 --workers 10.0.1.5:9100,10.0.1.6:9100
         """
     )
     
-    parser.add_argument('url', help='Target URL (ALB DNS name)')
-    parser.add_argument('rps', type=int, help='Requests per second')
+    parser.add_argument('url', nargs='?', help='Target URL (ALB DNS name)')
+    parser.add_argument('rps', nargs='?', type=int, help='Requests per second')
     parser.add_argument('--duration', type=int, 
                        help='Duration in seconds (default: infinite)')
     parser.add_argument('--threads', type=int, default=10,
                        help='Number of concurrent threads (default: 10)')
     parser.add_argument('--timeout', type=int, default=30,
                        help='Request timeout in seconds (default: 30)')
+    parser.add_argument('--new-connections', action='store_true',
+                       help='Open a new connection for every request instead of reusing keep-alive connections')
+    parser.add_argument('--response-mode', choices=RESPONSE_MODES, default='full',
+                       help='Response handling: full (buffer body), stream (count and discard body), '
+                            'head (HEAD requests), ttfb (time to first byte only) (default: full)')
+    parser.add_argument('--timeseries', metavar='PATH',
+                       help='Write per-second results to PATH for post-run analysis')
+    parser.add_argument('--timeseries-format', choices=TIMESERIES_FORMATS,
+                       help='Time-series file format (default: from PATH extension, .csv/.bin, else jsonl)')
+    parser.add_argument('--worker', action='store_true',
+                       help='Run as a distributed worker node and wait for a coordinator')
+    parser.add_argument('--listen', default=f'127.0.0.1:{DEFAULT_WORKER_PORT}', metavar='HOST:PORT',
+                       help=f'Address a worker node listens on (default: 127.0.0.1:{DEFAULT_WORKER_PORT}); '
+                            'non-loopback addresses require --token')
+    parser.add_argument('--workers', metavar='HOST:PORT[,HOST:PORT...]',
+                       help='Coordinate these worker nodes, splitting the requests per second across them')
+    parser.add_argument('--token', default=os.environ.get('LOADGEN_TOKEN'),
+                       help='Shared token between coordinator and workers (default: $LOADGEN_TOKEN)')
+    parser.add_argument('--start-delay', type=float, default=3.0,
+                       help='Seconds between sending jobs to workers and their shared start time (default: 3)')
     
     args = parser.parse_args()
     
+    if args.worker:
+        try:
+            host, port = parse_address(args.listen)
+            LoadWorker(host, port, token=args.token).serve()
+        except KeyboardInterrupt:
+            print("\n🛑 Worker stopped")
+        except Exception as e:
+            print(f"💥 Fatal error: {e}")
+            sys.exit(1)
+        return
+    
+    if args.url is None or args.rps is None:
+        parser.error("url and rps are required unless running with --worker")
+    
     # Validate arguments
     if args.rps <= 0:
         print("Error: requests per second must be positive")
@@ -343,12 +1502,43 @@ Examples:
         print("Error: timeout must be positive")
         sys.exit(1)
     
+    if not 0 <= args.start_delay <= MAX_START_DELAY:
+        print(f"Error: start delay must be between 0 and {MAX_START_DELAY} seconds")
+        sys.exit(1)
+    
     try:
         validated_url = validate_url(args.url)
     except ValueError as e:
         print(f"Error: {e}")
         sys.exit(1)
     
+    if args.workers:
+        if args.timeseries:
+            print("Error: --timeseries is not supported with --workers")
+            sys.exit(1)
+        
+        try:
+            workers = [parse_address(address) for address in args.workers.split(',') if address.strip()]
+            coordinator = LoadCoordinator(
+                target_url=validated_url,
+                requests_per_second=args.rps,
+                workers=workers,
+                duration=args.duration,
+                concurrent_threads=args.threads,
+                timeout=args.timeout,
+                keep_alive=not args.new_connections,
+                response_mode=args.response_mode,
+                start_delay=args.start_delay,
+                token=args.token
+            )
+            coordinator.start()
+        except KeyboardInterrupt:
+            print("\n🛑 Load generation interrupted by user")
+        except Exception as e:
+            print(f"💥 Fatal error: {e}")
+            sys.exit(1)
+        return
+    
     # Create and run load generator
     try:
         generator = LoadGenerator(
@@ -356,7 +1546,11 @@ Examples:
             requests_per_second=args.rps,
             duration=args.duration,
             concurrent_threads=args.threads,
-            timeout=args.timeout
+            timeout=args.timeout,
+            keep_alive=not args.new_connections,
+            response_mode=args.response_mode,
+            timeseries_path=args.timeseries,
+            timeseries_format=args.timeseries_format or timeseries_format_for(args.timeseries or '')
         )
         
         generator.start()